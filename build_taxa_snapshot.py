@@ -0,0 +1,41 @@
+# build_taxa_snapshot.py - regenerate the bundled high-level taxa snapshot
+#
+# Run this once (network required) before packaging a release:
+#
+#     python build_taxa_snapshot.py
+#
+# It writes high_level_taxa.json next to the app, which
+# fetch_high_level_taxa_cached() then loads instantly at startup instead of
+# querying WoRMS.
+import importlib.util
+import json
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(SCRIPT_DIR, "MarineScope-1.0.py")
+SNAPSHOT_PATH = os.path.join(SCRIPT_DIR, "high_level_taxa.json")
+
+
+def main():
+    spec = importlib.util.spec_from_file_location("marinescope", APP_PATH)
+    marinescope = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(marinescope)
+
+    # Force a live fetch even if a (stale) snapshot is already present
+    if os.path.exists(SNAPSHOT_PATH):
+        os.remove(SNAPSHOT_PATH)
+    marinescope.fetch_high_level_taxa_cached.cache_clear()
+
+    taxa = marinescope.fetch_high_level_taxa_cached()
+    if not taxa:
+        print("No taxa returned from WoRMS; snapshot not written")
+        sys.exit(1)
+
+    with open(SNAPSHOT_PATH, "w", encoding="utf-8") as f:
+        json.dump(taxa, f, ensure_ascii=False, indent=2)
+    print(f"Wrote {len(taxa)} taxa to {SNAPSHOT_PATH}")
+
+
+if __name__ == "__main__":
+    main()